@@ -11,7 +11,7 @@ import type { GeoJSONFeature } from "../../state/mapStoreTypes";
 import { OSM_Type } from "../../state/mapStoreTypes";
 import { fetchCandidates } from "../panels/TextSearchPanel";
 import { fetchFeaturesAtPoint } from "../../utils/magicWandSearch";
-import { countCoordinates, fixMultiPolygon } from "../utils/geometryUtils";
+import { countCoordinates, fixMultiPolygon, simplifyForDisplay } from "../utils/geometryUtils";
 import { describeOsmObject } from "../utils/describeOsmObject";
 import { calculateAreaInKm2 } from "../utils/geometryUtils";
 import { ListResultIcon, SearchIcon, InfoBubbleIcon } from "../ui/Icons";
@@ -132,7 +132,7 @@ export default function CreationPanelSearch({ query, searchTrigger, onPlaced }:
     if (selectedFeature?.geometry) {
       const geo = { ...selectedFeature, geometry: { ...selectedFeature.geometry } } as GeoJSONFeature;
       if ((geo.geometry as any).currentCoordinates) (geo.geometry as any).coordinates = (geo.geometry as any).currentCoordinates;
-      const layer = L.geoJSON(geo as any, {
+      const layer = L.geoJSON(simplifyForDisplay(geo) as any, {
         style: { color: "#f97316", weight: 2, fillOpacity: 0.3, dashArray: "8,8" },
       }).addTo(map);
       layerRef.current = layer;
@@ -18,6 +18,8 @@ import {
   enablePolygonDragging,
   shouldShowMarkerForPolygon,
   findCenterForMarker,
+  simplifyForDisplay,
+  displayToleranceForZoom,
 } from "../utils/geometryUtils";
 import { createMarker, attachMarkerDragHandlers } from "../utils/markerUtils";
 import type { GeoJSONFeature, MapState } from "../../state/mapStoreTypes";
@@ -85,11 +87,24 @@ async function findUserLocation(timeout = 3000) {
   }
 }
 
+// The user's location is looked up at most once. The promise is shared, so
+// re-running the map init effect doesn't fetch it again.
+let userLocationPromise: Promise<[number, number]> | null = null;
+function getUserLocation(): Promise<[number, number]> {
+  if (!userLocationPromise) userLocationPromise = findUserLocation();
+  return userLocationPromise;
+}
+
 export default function MapView() {
   const mapRef = useRef<HTMLDivElement>(null);
   const mapInstanceRef = useRef<L.Map | null>(null);
   const [mapReady, setMapReady] = useState(false);
   const geoJSONLayerGroupRef = useRef<L.LayerGroup | null>(null);
+  // Leaflet layer already drawn for each stored feature, so unchanged shapes
+  // aren't rebuilt on every store update (the store replaces edited features)
+  const renderedLayersRef = useRef<
+    Map<GeoJSONFeature, { layer: L.GeoJSON; isActive: boolean }>
+  >(new Map());
   const markersLayerGroupRef = useRef<L.LayerGroup | null>(null);
   const hoveredCandidateLayerRef = useRef<L.LayerGroup | null>(null);
   const markerToLayerMap = useRef<Map<L.Marker, L.GeoJSON>>(new Map());
@@ -130,7 +145,7 @@ export default function MapView() {
     let cancelled = false;
 
     const initMap = async () => {
-      const center = await findUserLocation();
+      const center = await getUserLocation();
       console.log(`Map center determined: ${center}`);
       if (cancelled) return;
 
@@ -222,27 +237,47 @@ export default function MapView() {
       return;
     }
 
-    if (geoJSONLayerGroupRef.current) {
-      geoJSONLayerGroupRef.current.clearLayers();
-      map.removeLayer(geoJSONLayerGroupRef.current);
+    // Create the layer group once per map instance
+    if (
+      !geoJSONLayerGroupRef.current ||
+      !map.hasLayer(geoJSONLayerGroupRef.current)
+    ) {
+      geoJSONLayerGroupRef.current = L.layerGroup().addTo(map);
+      renderedLayersRef.current.clear();
     }
+    const group = geoJSONLayerGroupRef.current;
 
-    const group = L.layerGroup().addTo(map);
-    geoJSONLayerGroupRef.current = group;
+    const previouslyRendered = renderedLayersRef.current;
+    const rendered = new Map<
+      GeoJSONFeature,
+      { layer: L.GeoJSON; isActive: boolean }
+    >();
+    let layersAdded = false;
 
     geojsonAreas.forEach((feature: GeoJSONFeature) => {
       const idx = feature.properties.id;
       const polygonColor = feature.properties?.color || "blue";
       const isActive = activeAreaId === idx;
-
-      // Clone the feature to avoid modifying the original
-      let featureToRender: GeoJSONFeature = JSON.parse(JSON.stringify(feature));
+      const style = {
+        color: polygonColor,
+        weight: isActive ? 4 : 2,
+        fillOpacity: 0.4,
+        opacity: isActive ? 0.9 : 0.7,
+      };
+
+      // Keep the existing layer if this feature hasn't changed, only
+      // restyling it when it became active or inactive
+      const existing = previouslyRendered.get(feature);
+      if (existing) {
+        previouslyRendered.delete(feature);
+        if (existing.isActive !== isActive) existing.layer.setStyle(style);
+        rendered.set(feature, { layer: existing.layer, isActive });
+        return;
+      }
 
       // Use currentCoordinates if available, otherwise use original coordinates
-      if (featureToRender.geometry.currentCoordinates) {
-        featureToRender.geometry.coordinates =
-          featureToRender.geometry.currentCoordinates;
-      }
+      let coordinates =
+        feature.geometry.currentCoordinates ?? feature.geometry.coordinates;
 
       // We'll only apply rotation when it's newly set through the rotation wheel,
       // not automatically during rendering after movement.
@@ -250,21 +285,23 @@ export default function MapView() {
       // and stored in a "rotatedCoordinates" property in the feature's geometry.
       // If we have pre-calculated rotated coordinates, use those instead of recalculating
       if (
-        featureToRender.geometry.rotatedCoordinates &&
-        featureToRender.properties.rotation !== 0
+        feature.geometry.rotatedCoordinates &&
+        feature.properties.rotation !== 0
       ) {
-        featureToRender.geometry.coordinates =
-          featureToRender.geometry.rotatedCoordinates;
+        coordinates = feature.geometry.rotatedCoordinates;
       }
 
-      const layer = L.geoJSON(featureToRender, {
-        style: {
-          color: polygonColor,
-          weight: isActive ? 4 : 2,
-          fillOpacity: 0.4,
-          opacity: isActive ? 0.9 : 0.7,
-        },
-      }).addTo(group);
+      // Shallow copy with the coordinates to draw swapped in. Leaflet only reads
+      // the coordinate arrays, so there's no need to deep-clone them; the drag
+      // handlers write to the copied geometry object, not the stored feature
+      const featureToRender: GeoJSONFeature = {
+        ...feature,
+        geometry: { ...feature.geometry, coordinates },
+      };
+
+      const layer = L.geoJSON(featureToRender, { style }).addTo(group);
+      rendered.set(feature, { layer, isActive });
+      layersAdded = true;
 
       // Add click handler to set active element
       layer.on("click", (e) => {
@@ -275,6 +312,15 @@ export default function MapView() {
       enablePolygonDragging(layer, map);
     });
 
+    // Whatever is left belongs to features that were removed or replaced
+    previouslyRendered.forEach(({ layer }) => group.removeLayer(layer));
+    renderedLayersRef.current = rendered;
+
+    // Replaced features were drawn on top; restore the stacking order of the list
+    if (layersAdded) {
+      rendered.forEach(({ layer }) => layer.bringToFront());
+    }
+
     if (geojsonAreas.length > numShapesRef.current) {
       // Find the newest shape(s) - those that were just added
       const newShapes = geojsonAreas.slice(numShapesRef.current);
@@ -510,7 +556,12 @@ export default function MapView() {
 
     // If there's a hovered candidate, render it with a highlight style
     if (hoveredCandidate) {
-      L.geoJSON(hoveredCandidate, {
+      // Only an outline preview, so detail below a pixel at this zoom is dropped
+      const preview = simplifyForDisplay(
+        hoveredCandidate,
+        displayToleranceForZoom(map.getZoom())
+      );
+      L.geoJSON(preview, {
         style: {
           color: "#FF4500", // Orange-red highlight color
           weight: 5,
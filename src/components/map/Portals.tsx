@@ -19,7 +19,10 @@ import {
   getPortalPositionOnEdge,
   type PortalEdge,
 } from "./portalUtils";
-import { hybridProjectAndTranslateGeometry } from "../utils/geometryUtils";
+import {
+  hybridProjectAndTranslateGeometry,
+  simplifyForDisplay,
+} from "../utils/geometryUtils";
 import "./Portals.css";
 
 function createMinimapTileLayer(layerType: MapLayerType): L.TileLayer {
@@ -140,10 +143,11 @@ export default function Portals({ mapRef, mapInstanceRef }: PortalsProps) {
       return;
     }
     const list: PortalEntry[] = [];
+    const viewBounds = m.getBounds();
     geojsonAreas.forEach((feature) => {
       const id = getPortalId(feature);
       if (!id) return;
-      if (!isShapeOffScreen(m, feature)) return;
+      if (!isShapeOffScreen(m, feature, viewBounds)) return;
       const center = getShapeCenter(feature);
       const pos = getPortalPositionOnEdge(m, L.latLng(center[0], center[1]), {
         creationPanelExpanded,
@@ -217,7 +221,7 @@ export default function Portals({ mapRef, mapInstanceRef }: PortalsProps) {
       } as GeoJSONFeature;
       const coords = (geo.geometry as any).currentCoordinates ?? geo.geometry.coordinates;
       (geo.geometry as any).coordinates = coords;
-      const layer = L.geoJSON(geo as any, {
+      const layer = L.geoJSON(simplifyForDisplay(geo) as any, {
         style: {
           color: geo.properties?.color ?? "#4287f5",
           weight: 2,
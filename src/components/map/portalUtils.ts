@@ -51,24 +51,49 @@ export function getShapeCenter(feature: GeoJSONFeature): [number, number] {
 }
 
 /**
- * Get LatLngBounds for a feature (current position).
+ * Bounding boxes keyed by the coordinates array they were computed from.
+ * Moving a shape replaces its coordinates array rather than mutating it, so a
+ * cached box can never go stale and entries are dropped along with the array.
  */
-export function getShapeBounds(feature: GeoJSONFeature): L.LatLngBounds {
-  const f = getFeatureForPosition(feature);
-  const layer = L.geoJSON(f as any);
-  const bounds = layer.getBounds();
-  return bounds;
+const shapeBBoxCache = new WeakMap<object, [number, number, number, number]>();
+
+/**
+ * Get the [minLng, minLat, maxLng, maxLat] box for a feature (current position).
+ * Computed once per coordinates array and reused on every map move.
+ */
+export function getShapeBBox(
+  feature: GeoJSONFeature
+): [number, number, number, number] {
+  const coords = getFeatureCoords(feature);
+  let bbox = shapeBBoxCache.get(coords);
+  if (!bbox) {
+    bbox = turf.bbox(getFeatureForPosition(feature)) as [
+      number,
+      number,
+      number,
+      number
+    ];
+    shapeBBoxCache.set(coords, bbox);
+  }
+  return bbox;
 }
 
 /**
  * Check if the shape is fully off-screen (no intersection with viewport).
+ * Pass `viewBounds` when testing many shapes against the same view.
  */
 export function isShapeOffScreen(
   map: L.Map,
-  feature: GeoJSONFeature
+  feature: GeoJSONFeature,
+  viewBounds: L.LatLngBounds = map.getBounds()
 ): boolean {
-  const bounds = getShapeBounds(feature);
-  return !map.getBounds().intersects(bounds);
+  const [minLng, minLat, maxLng, maxLat] = getShapeBBox(feature);
+  return (
+    maxLng < viewBounds.getWest() ||
+    minLng > viewBounds.getEast() ||
+    maxLat < viewBounds.getSouth() ||
+    minLat > viewBounds.getNorth()
+  );
 }
 
 export interface PortalPositionOptions {
@@ -11,6 +11,7 @@ import { countCoordinates, fixMultiPolygon } from "../utils/geometryUtils";
 import "../../styles/MagicWandPanel.css";
 import "../../styles/TextSearchPanel.css";
 import { useSettings } from "../../state/settingsStore";
+import { nominatimGet, nominatimLookup, overpassGet } from "../../utils/osmApi";
 
 export default function TextSearchPanel() {
   const [query, setQuery] = useState("");
@@ -46,7 +47,7 @@ export default function TextSearchPanel() {
         setError(helpMessage);
         return;
       }
-      console.log("Possible places:", possiblePlaces);
+      console.log(`Found ${possiblePlaces.length} possible places`);
 
       const geojsons = possiblePlaces.map((place: any) => {
         const osmType = place.osm_type;
@@ -128,40 +129,32 @@ export default function TextSearchPanel() {
    */
   const fetchFeaturesUsingOverpass = async (lat: number, lng: number) => {
     try {
-      // Construct the Overpass QL query to get both nearby features and containing areas
-      // This uses both around() for nearby features and is_in() for containing areas
+      // Construct the Overpass QL query to get nearby features with around().
+      // Only the element ids are used (Nominatim supplies names and geometry),
+      // so the query outputs nothing else.
       const distance = 25; // meters radius for nearby features
+      // Round to ~1m so nearby clicks produce the same (cacheable) query
+      const qLat = lat.toFixed(5);
+      const qLng = lng.toFixed(5);
+      // Untagged ways/relations (e.g. bare multipolygon members) are dropped by
+      // Overpass itself so they are never serialized or downloaded
       const query = `
                 [out:json][timeout:25];
                 (
-                    is_in(${lat}, ${lng});
-                    way(around:${distance},${lat},${lng});
-                    relation(around:${distance},${lat},${lng});
+                    way(around:${distance},${qLat},${qLng})(if:count_tags() > 0);
+                    relation(around:${distance},${qLat},${qLng})(if:count_tags() > 0);
                 );
-                out body;
+                out ids;
                 `;
 
-      const overpassUrl = "https://overpass-api.de/api/interpreter";
-      const response = await fetch(overpassUrl, {
-        method: "POST",
-        body: `data=${encodeURIComponent(query)}`,
-        headers: {
-          "Content-Type": "application/x-www-form-urlencoded",
-        },
-      });
-
-      if (!response.ok) {
-        throw new Error(`Overpass API error: ${response.statusText}`);
-      }
-
-      const data = await response.json();
-      console.log("Overpass API response:", data);
+      // Served from the local Overpass cache when this query was made recently
+      const data = await overpassGet(query);
+      console.log(`Overpass returned ${data.elements.length} elements`);
 
-      // Filter out valid candidates (ways and relations only)
+      // Filter out valid candidates (ways and relations only). Untagged
+      // elements were already excluded by the query, so no tag check is needed
       const candidates = data.elements.filter(
-        (element: any) =>
-          (element.type === "way" || element.type === "relation") &&
-          element.tags
+        (element: any) => element.type === "way" || element.type === "relation"
       );
 
       // If no candidates found, return empty array
@@ -175,80 +168,55 @@ export default function TextSearchPanel() {
         return `${prefix}${element.id}`;
       });
 
-      // Split into batches of 50 as Nominatim has a limit
-      const batchSize = 50;
-      const batches = [];
-
-      for (let i = 0; i < nominatimIds.length; i += batchSize) {
-        batches.push(nominatimIds.slice(i, i + batchSize));
-      }
-      console.log("Nominatim batches:", batches);
-
-      // Process each batch and combine results
-      const features: GeoJSONFeature[] = [];
-
-      for (const batch of batches) {
-        const nominatimUrl = `https://nominatim.openstreetmap.org/lookup?osm_ids=${batch.join(
-          ","
-        )}&format=json&polygon_geojson=1&extratags=1`;
-
-        const nominatimResponse = await fetch(nominatimUrl);
+      // Batches of 50 ids are looked up one after the other and combined in
+      // order. Each Nominatim result is processed into a GeoJSON feature as
+      // soon as its batch arrives.
+      const features = await nominatimLookup(
+        nominatimIds,
+        (place: any): GeoJSONFeature | null => {
+          // Ensure it has valid GeoJSON
+          if (
+            !place.geojson ||
+            (place.geojson.type !== "Polygon" &&
+              place.geojson.type !== "MultiPolygon")
+          ) {
+            return null;
+          }
 
-        if (!nominatimResponse.ok) {
-          console.warn(
-            `Nominatim API error for batch: ${nominatimResponse.statusText}`
-          );
-          continue;
+          // Create a GeoJSON feature similar to TextSearchPanel
+          const feature: GeoJSONFeature = {
+            type: "Feature" as "Feature",
+            geometry: {
+              type:
+                place.geojson.type === "Polygon" ? "Polygon" : "MultiPolygon",
+              coordinates: place.geojson.coordinates,
+              coordinateCount: countCoordinates(place.geojson.coordinates),
+            },
+            properties: {
+              name: place.display_name,
+              osmType: place.osm_type,
+              osmId: place.osm_id.toString(),
+              osmClass: place.class,
+              whatIsIt: describeOsmObject(place),
+              // Determine if this is nearby or containing (similar logic as before)
+              source:
+                place.address &&
+                (place.address.city ||
+                  place.address.county ||
+                  place.address.state)
+                  ? "containing"
+                  : "nearby",
+              adminLevel: place.extratags?.admin_level
+                ? parseInt(place.extratags.admin_level, 10)
+                : 0,
+              tags: place.extratags || {},
+            },
+          };
+
+          return fixMultiPolygon(feature);
         }
-
-        const nominatimData = await nominatimResponse.json();
-        console.log("Nominatim data:", nominatimData);
-
-        // Process each Nominatim result into a GeoJSON feature
-        const batchFeatures = nominatimData
-          .filter(
-            (place: any) =>
-              // Ensure it has valid GeoJSON
-              place.geojson &&
-              (place.geojson.type === "Polygon" ||
-                place.geojson.type === "MultiPolygon")
-          )
-          .map((place: any) => {
-            // Create a GeoJSON feature similar to TextSearchPanel
-            const feature: GeoJSONFeature = {
-              type: "Feature" as "Feature",
-              geometry: {
-                type:
-                  place.geojson.type === "Polygon" ? "Polygon" : "MultiPolygon",
-                coordinates: place.geojson.coordinates,
-                coordinateCount: countCoordinates(place.geojson.coordinates),
-              },
-              properties: {
-                name: place.display_name,
-                osmType: place.osm_type,
-                osmId: place.osm_id.toString(),
-                osmClass: place.class,
-                whatIsIt: describeOsmObject(place),
-                // Determine if this is nearby or containing (similar logic as before)
-                source:
-                  place.address &&
-                  (place.address.city ||
-                    place.address.county ||
-                    place.address.state)
-                    ? "containing"
-                    : "nearby",
-                adminLevel: place.extratags?.admin_level
-                  ? parseInt(place.extratags.admin_level, 10)
-                  : 0,
-                tags: place.extratags || {},
-              },
-            };
-
-            return fixMultiPolygon(feature);
-          });
-
-        features.push(...batchFeatures);
-      }
+      );
+      console.log(`Nominatim returned ${features.length} polygon features`);
 
       return features;
     } catch (error) {
@@ -317,7 +285,7 @@ export default function TextSearchPanel() {
     try {
       // Fetch features using our improved two-step approach
       const features = await fetchFeaturesUsingOverpass(lat, lng);
-      console.log("Features from two-step fetch:", features);
+      console.log(`Two-step fetch found ${features.length} features`);
 
       // Organize features
       const organizedFeatures = organizeFeatures(features);
@@ -514,22 +482,24 @@ export async function fetchCandidates(input: string) {
     lat + delta, // bottom
   ].join(",");
 
-  let nearbyResponse = await fetch(
+  // Both searches go through the shared rate limiter, which spaces them one
+  // second apart as Nominatim's usage policy requires. Repeating a recent
+  // search reuses the parsed responses.
+  const nearbyData = await nominatimGet(
     `https://nominatim.openstreetmap.org/search?format=json&polygon_geojson=1&extratags=1&q=${encodeURIComponent(
       input
     )}&viewbox=${viewbox}&bounded=1`
   );
 
-  let nominatimResponse = await fetch(
+  const nominatimDataRaw = await nominatimGet(
     `https://nominatim.openstreetmap.org/search?format=json&polygon_geojson=1&extratags=1&q=${encodeURIComponent(
       input
     )}`
   );
 
-  const [nearbyData, nominatimDataRaw] = await Promise.all([
-    nearbyResponse.json(),
-    nominatimResponse.json(),
-  ]);
+  if (nearbyData === null || nominatimDataRaw === null) {
+    throw new Error("Nominatim search failed");
+  }
 
   // Helper to check if a polygon is closed
   function isClosedPolygon(geojson: any): boolean {
@@ -40,19 +40,25 @@ const SvgCard: React.FC<SvgCardProps> = ({
 }) => {
   const currentMapCenter = useMapStore((state) => state.currentMapCenter);
 
-  // Convert SVG to GeoJSON feature
-  const geoJsonFeature = useMemo(() => {
-    if (!currentMapCenter) return null;
-
+  // Sample the SVG outline once; it doesn't depend on where the map is
+  const sampledPath = useMemo(() => {
     // Extract paths and viewBox
     const paths = extractPathsFromSvg(svgContent);
-    const viewBox = extractViewBox(svgContent);
 
     // Use the longest path (typically the main outline)
     const pathData = getLongestPath(paths);
 
     if (!pathData) return null;
 
+    return sampleSvgPath(pathData, samplePoints);
+  }, [svgContent, samplePoints]);
+
+  // Place the sampled outline on the map (cheap, so redone when the map moves)
+  const geoJsonFeature = useMemo(() => {
+    if (!currentMapCenter || !sampledPath) return null;
+
+    const viewBox = extractViewBox(svgContent);
+
     // Calculate aspect ratio from viewBox if available
     let actualWidth = widthInMeters;
     let actualHeight = heightInMeters;
@@ -66,24 +72,22 @@ const SvgCard: React.FC<SvgCardProps> = ({
       }
     }
 
-    // We'll still use the existing svgPathToGeoJSONFeature function, but now we call it with our extracted path
-    return svgPathToGeoJSONFeature(
-      pathData,
+    return sampledPathToGeoJSONFeature(
+      sampledPath,
       actualWidth,
       actualHeight,
       [currentMapCenter[1], currentMapCenter[0]], // Flip coordinates as required by the function
-      samplePoints,
       name,
       description
     );
   }, [
     currentMapCenter,
+    sampledPath,
     svgContent,
     name,
     description,
     widthInMeters,
     heightInMeters,
-    samplePoints,
   ]);
 
   // If we couldn't create a feature, return null
@@ -93,67 +97,104 @@ const SvgCard: React.FC<SvgCardProps> = ({
   return <Card feature={geoJsonFeature} iconUrl={svgUrl} />;
 };
 
+interface SampledSvgPath {
+  xs: Float64Array;
+  ys: Float64Array;
+  minX: number;
+  maxX: number;
+  minY: number;
+  maxY: number;
+}
+
+/**
+ * Sample evenly spaced points along an SVG path, tracking the bounding box of
+ * the raw SVG points as we go instead of scanning them again afterwards
+ */
+function sampleSvgPath(
+  svgPath: string,
+  samplePoints: number = 100
+): SampledSvgPath | null {
+  try {
+    const props = new svgPathProperties(svgPath);
+    const totalLength = props.getTotalLength();
+
+    // Step 1: Sample the path and track its bounding box
+    const xs = new Float64Array(samplePoints);
+    const ys = new Float64Array(samplePoints);
+    let minX = Infinity;
+    let maxX = -Infinity;
+    let minY = Infinity;
+    let maxY = -Infinity;
+    for (let i = 0; i < samplePoints; i++) {
+      const p = props.getPointAtLength((i / (samplePoints - 1)) * totalLength);
+      xs[i] = p.x;
+      ys[i] = p.y;
+      if (p.x < minX) minX = p.x;
+      if (p.x > maxX) maxX = p.x;
+      if (p.y < minY) minY = p.y;
+      if (p.y > maxY) maxY = p.y;
+    }
+
+    return { xs, ys, minX, maxX, minY, maxY };
+  } catch (error) {
+    console.error(
+      `sampleSvgPath: Error occurred while sampling SVG path`,
+      error
+    );
+    return null; // Return null if sampling fails
+  }
+}
+
 // Import the function from SpecialPanel to avoid circular dependencies
 // In a real implementation, this should be moved to a shared utility file
-function svgPathToGeoJSONFeature(
-  svgPath: string,
+function sampledPathToGeoJSONFeature(
+  sampledPath: SampledSvgPath,
   widthInMeters: number,
   heightInMeters: number,
   centerLatLng: [number, number], // [lng, lat] in degrees
-  samplePoints: number = 100,
   featureDisplayName = "Custom Shape",
   whatIsIt = "Converted from SVG"
 ): GeoJSONFeature | null {
   try {
     const [centerLng, centerLat] = centerLatLng;
-
-    const props = new svgPathProperties(svgPath);
-    const totalLength = props.getTotalLength();
-
-    const rawPoints = Array.from({ length: samplePoints }, (_, i) =>
-      props.getPointAtLength((i / (samplePoints - 1)) * totalLength)
-    );
+    const { xs, ys, minX, maxX, minY, maxY } = sampledPath;
+    const samplePoints = xs.length;
 
     // Step 2: Get bounding box dimensions of the raw SVG path
-    const minX = Math.min(...rawPoints.map((p) => p.x));
-    const maxX = Math.max(...rawPoints.map((p) => p.x));
-    const minY = Math.min(...rawPoints.map((p) => p.y));
-    const maxY = Math.max(...rawPoints.map((p) => p.y));
     const bboxWidth = maxX - minX;
     const bboxHeight = maxY - minY;
 
-    // Step 3: Normalize and scale to meters
-    const scaledToMeters: [number, number][] = rawPoints.map((p) => {
-      const x = ((p.x - minX) / bboxWidth - 0.5) * widthInMeters; // center at 0
-      const y = -((p.y - minY) / bboxHeight - 0.5) * heightInMeters;
-      return [x, y]; // in meters
-    });
-
-    // Step 4: Convert meters to lat/lng degrees
-    const metersToLatLng = ([mx, my]: [number, number]): [number, number] => {
-      // Use a more stable calculation that's less affected by latitude
-      const latOffset = my / 111_320; // meters per degree latitude
-      const lngOffset = mx / (111_320 * Math.cos((centerLat * Math.PI) / 180));
-
-      return [centerLng + lngOffset, centerLat + latOffset];
-    };
-
-    const geoPoints = scaledToMeters.map(metersToLatLng);
+    // Step 3 & 4: Normalize and scale to meters, then convert to lat/lng
+    // degrees, writing each point straight into the coordinate array
+    // Use a more stable calculation that's less affected by latitude
+    const degreesPerMeterLat = 1 / 111_320; // 111,320 meters per degree latitude
+    const degreesPerMeterLng =
+      1 / (111_320 * Math.cos((centerLat * Math.PI) / 180));
+
+    const geoPoints: [number, number][] = new Array(samplePoints);
+    for (let i = 0; i < samplePoints; i++) {
+      const mx = ((xs[i] - minX) / bboxWidth - 0.5) * widthInMeters; // center at 0
+      const my = -((ys[i] - minY) / bboxHeight - 0.5) * heightInMeters;
+      geoPoints[i] = [
+        centerLng + mx * degreesPerMeterLng,
+        centerLat + my * degreesPerMeterLat,
+      ];
+    }
 
     // Step 5: Ensure polygon is closed
-    const closedGeoPoints =
-      JSON.stringify(geoPoints[0]) ===
-      JSON.stringify(geoPoints[geoPoints.length - 1])
-        ? geoPoints
-        : [...geoPoints, geoPoints[0]];
+    const first = geoPoints[0];
+    const last = geoPoints[geoPoints.length - 1];
+    if (first[0] !== last[0] || first[1] !== last[1]) {
+      geoPoints.push([first[0], first[1]]);
+    }
 
     // Step 6: Return GeoJSON Feature
     return {
       type: "Feature",
       geometry: {
         type: "Polygon",
-        coordinates: [closedGeoPoints],
-        coordinateCount: countCoordinates([closedGeoPoints]),
+        coordinates: [geoPoints],
+        coordinateCount: countCoordinates([geoPoints]),
       },
       properties: {
         name: featureDisplayName,
@@ -167,7 +208,7 @@ function svgPathToGeoJSONFeature(
     };
   } catch (error) {
     console.error(
-      `svgPathToGeoJSONFeature: Error occurred while converting SVG path to GeoJSON`,
+      `sampledPathToGeoJSONFeature: Error occurred while converting SVG path to GeoJSON`,
       error
     );
     return null; // Return null if conversion fails
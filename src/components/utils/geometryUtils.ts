@@ -24,16 +24,17 @@ import { useSettings } from "../../state/settingsStore";
  */
 
 export const countCoordinates = (coords: any[]): number => {
-  if (!Array.isArray(coords)) return 0;
-  if (
-    coords.length === 2 &&
-    typeof coords[0] === "number" &&
-    typeof coords[1] === "number"
-  ) {
-    return 1; // Base case: this is a coordinate pair [lng, lat]
+  if (!Array.isArray(coords) || coords.length === 0) return 0;
+  if (typeof coords[0] === "number") {
+    return 1; // Base case: this is a single coordinate [lng, lat]
+  }
+  if (Array.isArray(coords[0]) && typeof coords[0][0] === "number") {
+    return coords.length; // A ring of coordinates: count it in one step
   }
-  // Recursive case: sum up points in nested arrays
-  return coords.reduce((sum, item) => sum + countCoordinates(item), 0);
+  // Recursive case: sum up points in nested rings/polygons
+  let total = 0;
+  for (const item of coords) total += countCoordinates(item);
+  return total;
 };
 
 // There are a couple ways to do this
@@ -232,6 +233,7 @@ export function enablePolygonDragging(
     if (!(innerLayer instanceof L.Polygon)) return;
 
     let originalLatLngs: any = null;
+    let originalCentroid: [number, number] | null = null;
     let dragStartLatLng: L.LatLng | null = null;
     let hasMoved = false;
     const moveThreshold = 3; // Pixels to consider a drag vs a click
@@ -265,6 +267,15 @@ export function enablePolygonDragging(
       const latLngs = innerLayer.getLatLngs();
       originalLatLngs = JSON.parse(JSON.stringify(latLngs));
 
+      // The feature doesn't change during the drag, so find its centroid once
+      // here rather than on every mousemove
+      const dragFeature = (innerLayer as any).feature as
+        | GeoJSON.Feature
+        | undefined;
+      originalCentroid = dragFeature?.geometry
+        ? (turf.centroid(dragFeature).geometry.coordinates as [number, number])
+        : null;
+
       // Find the associated marker
       associatedMarker = findAssociatedMarker();
 
@@ -288,25 +299,23 @@ export function enablePolygonDragging(
           const feature = (innerLayer as any).feature as
             | GeoJSON.Feature
             | undefined;
-          if (feature && feature.geometry) {
-            // Deep clone the feature to avoid modifying the original
-            const featureToTransform = JSON.parse(JSON.stringify(feature));
-
+          if (feature && feature.geometry && originalCentroid) {
             // Calculate the displacement from the drag start position
             const latDiff = e.latlng.lat - dragStartLatLng.lat;
             const lngDiff = e.latlng.lng - dragStartLatLng.lng;
 
             // Calculate target coordinates based on the original feature's centroid plus the displacement
-            const originalCentroid = turf.centroid(featureToTransform);
             const targetCoordinates: [number, number] = [
-              originalCentroid.geometry.coordinates[0] + lngDiff,
-              originalCentroid.geometry.coordinates[1] + latDiff,
+              originalCentroid[0] + lngDiff,
+              originalCentroid[1] + latDiff,
             ];
 
-            // Use our hybrid transformation for accurate shape preservation
+            // Use our hybrid transformation for accurate shape preservation.
+            // It returns a new feature, so the original is left unmodified
             const transformedFeature = hybridProjectAndTranslateGeometry(
-              featureToTransform,
-              targetCoordinates
+              feature as GeoJSON.Feature<GeoJSON.Polygon | GeoJSON.MultiPolygon>,
+              targetCoordinates,
+              originalCentroid
             );
 
             // Convert GeoJSON coordinates to Leaflet LatLngs and update the polygon
@@ -428,6 +437,7 @@ export function enablePolygonDragging(
         } finally {
           // Clean up references
           originalLatLngs = null;
+          originalCentroid = null;
           dragStartLatLng = null;
           associatedMarker = null;
         }
@@ -535,10 +545,14 @@ export function rotateFeature(
   const projName = `+proj=tmerc +lat_0=${centerLat} +lon_0=${centerLng} +units=m +datum=WGS84`;
   proj4.defs("LOCAL", projName);
 
+  // Build the converter once; proj4(from, to, point) would re-create both
+  // projections for every single vertex
+  const localProjection = proj4("WGS84", "LOCAL");
+
   // Helper: rotate a 2D point (in meters) around origin
+  const cosA = Math.cos(angleRad);
+  const sinA = Math.sin(angleRad);
   function rotateXY([x, y]: [number, number]): [number, number] {
-    const cosA = Math.cos(angleRad);
-    const sinA = Math.sin(angleRad);
     return [x * cosA - y * sinA, x * sinA + y * cosA];
   }
 
@@ -546,10 +560,10 @@ export function rotateFeature(
   function rotateCoordinates(coords: any[]): any[] {
     if (typeof coords[0] === "number") {
       // Project to local XY
-      const [x, y] = proj4("WGS84", "LOCAL", coords);
+      const [x, y] = localProjection.forward(coords);
       const [xRot, yRot] = rotateXY([x, y]);
       // Unproject back to lat/lng
-      return proj4("LOCAL", "WGS84", [xRot, yRot]);
+      return localProjection.inverse([xRot, yRot]);
     }
     return coords.map(rotateCoordinates);
   }
@@ -676,40 +690,23 @@ export function projectAndTranslateGeometry(
  *
  * This prevents the "spinning" effect when moving shapes horizontally while
  * still maintaining proper north-south distortion.
+ *
+ * Pass `originalCentroid` when translating the same feature repeatedly
+ * (e.g. while dragging) so it isn't recomputed on every call.
  */
 export function hybridProjectAndTranslateGeometry(
   feature: GeoJSON.Feature<GeoJSON.Polygon | GeoJSON.MultiPolygon>,
-  targetCoordinates: [number, number]
+  targetCoordinates: [number, number],
+  originalCentroid?: [number, number]
 ): GeoJSON.Feature<GeoJSON.Polygon | GeoJSON.MultiPolygon> {
-  const originalCentroid = turf.centroid(feature).geometry.coordinates as [
-    number,
-    number
-  ];
+  const centroid =
+    originalCentroid ??
+    (turf.centroid(feature).geometry.coordinates as [number, number]);
 
   // Calculate longitude and latitude differences
-  const lngDiff = targetCoordinates[0] - originalCentroid[0];
-  const latDiff = targetCoordinates[1] - originalCentroid[1];
-
-  // Clone feature to avoid modifying original
-  const result = JSON.parse(JSON.stringify(feature));
-
-  // First pass: Apply horizontal translation directly
-  function applyHorizontalTranslation(coords: any[]): any[] {
-    if (typeof coords[0] === "number" && typeof coords[1] === "number") {
-      // Base case: single [lng, lat] coordinate
-      return [coords[0] + lngDiff, coords[1]];
-    }
-    // Recursive case for nested arrays
-    return coords.map(applyHorizontalTranslation);
-  }
+  const lngDiff = targetCoordinates[0] - centroid[0];
+  const latDiff = targetCoordinates[1] - centroid[1];
 
-  // Apply horizontal translation
-  result.geometry.coordinates = applyHorizontalTranslation(
-    result.geometry.coordinates
-  );
-
-  // We need to create a feature that has the horizontally translated coordinates
-  // but only apply the vertical rotation component
   const radians = (deg: number) => (deg * Math.PI) / 180;
   const degrees = (rad: number) => (rad * 180) / Math.PI;
 
@@ -738,89 +735,92 @@ export function hybridProjectAndTranslateGeometry(
     return [x / mag, y / mag, z / mag];
   }
 
-  // For vertical-only transformation, we need a special approach
-  // We'll create vectors that only differ in their vertical component
-  const horizontallyTranslatedCentroid = turf.centroid(result).geometry
-    .coordinates as [number, number];
-
-  // Create unit vectors for vertical-only transformation
-  const fromVector = normalize(toCartesian(horizontallyTranslatedCentroid));
-  // For the target vector, we want to keep the same horizontal component but change the vertical
-  const toVector = normalize(
-    toCartesian([
-      horizontallyTranslatedCentroid[0],
-      horizontallyTranslatedCentroid[1] + latDiff,
-    ])
-  );
+  function cross(
+    a: [number, number, number],
+    b: [number, number, number]
+  ): [number, number, number] {
+    return [
+      a[1] * b[2] - a[2] * b[1],
+      a[2] * b[0] - a[0] * b[2],
+      a[0] * b[1] - a[1] * b[0],
+    ];
+  }
 
-  // Only if there's vertical movement to apply
-  if (Math.abs(latDiff) > 0.000001) {
-    // This is the vertical-only rotation logic
-
-    // Cross product and dot product for rotation
-    function cross(
-      a: [number, number, number],
-      b: [number, number, number]
-    ): [number, number, number] {
-      return [
-        a[1] * b[2] - a[2] * b[1],
-        a[2] * b[0] - a[0] * b[2],
-        a[0] * b[1] - a[1] * b[0],
-      ];
-    }
+  function dot(
+    a: [number, number, number],
+    b: [number, number, number]
+  ): number {
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2];
+  }
 
-    function dot(
-      a: [number, number, number],
-      b: [number, number, number]
-    ): number {
-      return a[0] * b[0] + a[1] * b[1] + a[2] * b[2];
-    }
+  // Shifting every vertex by lngDiff shifts the (vertex-average) centroid by
+  // exactly lngDiff, so the horizontally translated centroid needs no second pass
+  const horizontallyTranslatedCentroid: [number, number] = [
+    centroid[0] + lngDiff,
+    centroid[1],
+  ];
 
-    // Rodrigues' rotation formula for the vertical component
-    function rotateVector(
-      v: [number, number, number],
-      axis: [number, number, number],
-      angle: number
-    ): [number, number, number] {
-      const cosA = Math.cos(angle);
-      const sinA = Math.sin(angle);
-      const dotAV = dot(axis, v);
-      const crossAV = cross(axis, v);
-
-      return [
-        v[0] * cosA + crossAV[0] * sinA + axis[0] * dotAV * (1 - cosA),
-        v[1] * cosA + crossAV[1] * sinA + axis[1] * dotAV * (1 - cosA),
-        v[2] * cosA + crossAV[2] * sinA + axis[2] * dotAV * (1 - cosA),
-      ];
-    }
+  // Only if there's vertical movement to apply
+  const applyVerticalRotation = Math.abs(latDiff) > 0.000001;
+
+  // Rotation axis and angle for the vertical-only transformation, computed once
+  // (the axis should be mostly east-west for vertical movement)
+  let rotationAxis: [number, number, number] = [0, 0, 1];
+  let cosA = 1;
+  let sinA = 0;
+  if (applyVerticalRotation) {
+    // Create unit vectors that only differ in their vertical component
+    const fromVector = normalize(toCartesian(horizontallyTranslatedCentroid));
+    const toVector = normalize(
+      toCartesian([
+        horizontallyTranslatedCentroid[0],
+        horizontallyTranslatedCentroid[1] + latDiff,
+      ])
+    );
 
-    // Compute rotation axis (should be mostly east-west for vertical movement)
-    const rotationAxis = normalize(cross(fromVector, toVector));
+    rotationAxis = normalize(cross(fromVector, toVector));
     const rotationAngle = Math.acos(
       Math.min(1, Math.max(-1, dot(fromVector, toVector)))
     );
+    cosA = Math.cos(rotationAngle);
+    sinA = Math.sin(rotationAngle);
+  }
 
-    // Apply the vertical rotation transformation
-    function applyVerticalRotation(coords: any[]): any[] {
-      if (typeof coords[0] === "number" && typeof coords[1] === "number") {
-        // Convert to cartesian, rotate, then back to lng/lat
-        const cartesian = toCartesian([coords[0], coords[1]] as [
-          number,
-          number
-        ]);
-        const rotated = rotateVector(cartesian, rotationAxis, rotationAngle);
-        return toLngLat(rotated);
-      }
-      return coords.map(applyVerticalRotation);
-    }
+  // Rodrigues' rotation formula for the vertical component
+  function rotateVector(
+    v: [number, number, number]
+  ): [number, number, number] {
+    const dotAV = dot(rotationAxis, v);
+    const crossAV = cross(rotationAxis, v);
 
-    // Apply vertical rotation to already horizontally translated coordinates
-    result.geometry.coordinates = applyVerticalRotation(
-      result.geometry.coordinates
-    );
+    return [
+      v[0] * cosA + crossAV[0] * sinA + rotationAxis[0] * dotAV * (1 - cosA),
+      v[1] * cosA + crossAV[1] * sinA + rotationAxis[1] * dotAV * (1 - cosA),
+      v[2] * cosA + crossAV[2] * sinA + rotationAxis[2] * dotAV * (1 - cosA),
+    ];
   }
 
-  return result;
+  // Single pass over the coordinates: apply the horizontal translation directly,
+  // then the vertical rotation, building new arrays as we go
+  function transformCoords(coords: any[]): any[] {
+    if (typeof coords[0] === "number" && typeof coords[1] === "number") {
+      // Base case: single [lng, lat] coordinate
+      const translated: [number, number] = [coords[0] + lngDiff, coords[1]];
+      if (!applyVerticalRotation) return translated;
+      return toLngLat(rotateVector(toCartesian(translated)));
+    }
+    // Recursive case for nested arrays
+    return coords.map(transformCoords);
+  }
+
+  // The coordinates are rebuilt above, so only the containers need copying
+  return {
+    ...feature,
+    geometry: {
+      ...feature.geometry,
+      coordinates: transformCoords(feature.geometry.coordinates),
+    },
+  } as GeoJSON.Feature<GeoJSON.Polygon | GeoJSON.MultiPolygon>;
 }
 
 export function fixMultiPolygon(feature: GeoJSONFeature): GeoJSONFeature {
@@ -849,3 +849,46 @@ export function fixMultiPolygon(feature: GeoJSONFeature): GeoJSONFeature {
 
   return feature;
 }
+
+// Shapes with at most this many points are drawn as-is in previews
+const DISPLAY_SIMPLIFY_MIN_POINTS = 2000;
+
+/**
+ * Get a lighter copy of a feature for display-only rendering (hover
+ * highlights, minimaps). Detail smaller than `tolerance` degrees can't be seen
+ * anyway; when no tolerance is given, one five-hundredth of the shape's extent
+ * is used, which is below a pixel in a small preview that fits the shape.
+ * The feature stored on the map is never modified.
+ */
+export function simplifyForDisplay(
+  feature: GeoJSONFeature,
+  tolerance?: number
+): GeoJSONFeature {
+  const pointCount =
+    feature.geometry.coordinateCount ??
+    countCoordinates(feature.geometry.coordinates);
+  if (pointCount <= DISPLAY_SIMPLIFY_MIN_POINTS) return feature;
+
+  if (tolerance === undefined) {
+    const [minX, minY, maxX, maxY] = turf.bbox(feature as any);
+    tolerance = Math.max(maxX - minX, maxY - minY) / 500;
+  }
+
+  try {
+    return turf.simplify(feature as any, {
+      tolerance,
+      highQuality: false,
+      mutate: false,
+    }) as GeoJSONFeature;
+  } catch (e) {
+    console.warn("Failed to simplify feature for display:", e);
+    return feature;
+  }
+}
+
+/**
+ * Size of half a screen pixel in degrees at the given Web Mercator zoom level
+ */
+export function displayToleranceForZoom(zoom: number): number {
+  return 360 / (256 * Math.pow(2, zoom)) / 2;
+}
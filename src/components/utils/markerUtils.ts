@@ -148,6 +148,7 @@ export function attachMarkerDragHandlers(
 ) {
   let dragStartLatLng: L.LatLng;
   let originalPolygonCoords: any = null;
+  let originalCentroid: [number, number] | null = null;
   let hasMoved = false;
   const moveThreshold = 3; // Pixels to consider a drag vs a click
   let activePolygon: L.Polygon | null = null;
@@ -215,6 +216,13 @@ export function attachMarkerDragHandlers(
       originalPolygonCoords = JSON.parse(
         JSON.stringify(activePolygon.getLatLngs())
       );
+
+      // The feature doesn't change during the drag, so find its centroid once
+      // here rather than on every drag event
+      const dragFeature = activePolygon.feature as GeoJSON.Feature | undefined;
+      originalCentroid = dragFeature?.geometry
+        ? (turf.centroid(dragFeature).geometry.coordinates as [number, number])
+        : null;
     }
   });
 
@@ -233,26 +241,24 @@ export function attachMarkerDragHandlers(
     try {
       // Get the feature associated with this polygon for projection-based transformation
       const feature = activePolygon.feature as GeoJSON.Feature | undefined;
-      if (feature && feature.geometry) {
-        // Deep clone the feature to avoid modifying the original
-        const featureToTransform = JSON.parse(JSON.stringify(feature));
-
+      if (feature && feature.geometry && originalCentroid) {
         // Calculate the displacement from the drag start position
         const current = marker.getLatLng();
         const latDiff = current.lat - dragStartLatLng.lat;
         const lngDiff = current.lng - dragStartLatLng.lng;
 
         // Calculate target coordinates based on the original feature's centroid plus the displacement
-        const originalCentroid = turf.centroid(featureToTransform);
         const targetCoordinates: [number, number] = [
-          originalCentroid.geometry.coordinates[0] + lngDiff,
-          originalCentroid.geometry.coordinates[1] + latDiff,
+          originalCentroid[0] + lngDiff,
+          originalCentroid[1] + latDiff,
         ];
 
-        // Use our hybrid transformation for accurate shape preservation
+        // Use our hybrid transformation for accurate shape preservation.
+        // It returns a new feature, so the original is left unmodified
         const transformedFeature = hybridProjectAndTranslateGeometry(
-          featureToTransform,
-          targetCoordinates
+          feature as GeoJSON.Feature<GeoJSON.Polygon | GeoJSON.MultiPolygon>,
+          targetCoordinates,
+          originalCentroid
         );
 
         // Convert GeoJSON coordinates to Leaflet LatLngs and update the polygon
@@ -343,6 +349,7 @@ export function attachMarkerDragHandlers(
     } finally {
       // Clean up
       originalPolygonCoords = null;
+      originalCentroid = null;
       activePolygon = null;
     }
   });
@@ -54,10 +54,14 @@ export function applyRotation(
   const projName = `+proj=tmerc +lat_0=${centerLat} +lon_0=${centerLng} +units=m +datum=WGS84`;
   proj4.defs("LOCAL", projName);
 
+  // Build the converter once; proj4(from, to, point) would re-create both
+  // projections for every single vertex
+  const localProjection = proj4("WGS84", "LOCAL");
+
   // Helper: rotate a 2D point (in meters) around origin
+  const cosA = Math.cos(angleRad);
+  const sinA = Math.sin(angleRad);
   function rotateXY([x, y]: [number, number]): [number, number] {
-    const cosA = Math.cos(angleRad);
-    const sinA = Math.sin(angleRad);
     return [x * cosA - y * sinA, x * sinA + y * cosA];
   }
 
@@ -65,10 +69,10 @@ export function applyRotation(
   function rotateCoordinates(coords: any[]): any[] {
     if (typeof coords[0] === "number") {
       // Project to local XY
-      const [x, y] = proj4("WGS84", "LOCAL", coords);
+      const [x, y] = localProjection.forward(coords);
       const [xRot, yRot] = rotateXY([x, y]);
       // Unproject back to lat/lng
-      return proj4("LOCAL", "WGS84", [xRot, yRot]);
+      return localProjection.inverse([xRot, yRot]);
     }
     return coords.map(rotateCoordinates);
   }
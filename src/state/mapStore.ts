@@ -1,7 +1,10 @@
 // src/state/mapStore.ts
 import { create } from "zustand";
 import { generateRandomColor } from "../components/utils/colorUtils";
-import { hybridProjectAndTranslateGeometry } from "../components/utils/geometryUtils";
+import {
+  countCoordinates,
+  hybridProjectAndTranslateGeometry,
+} from "../components/utils/geometryUtils";
 import type { MapArea, GeoJSONFeature, MapState } from "./mapStoreTypes";
 import * as turf from "@turf/turf"; // TODO: what does this import other than simplify?
 import { useSettings } from "./settingsStore";
@@ -15,6 +18,12 @@ export type AddFromSearchOptions = { placeAtCenter?: boolean };
 // Key for storing history in localStorage
 const HISTORY_STORAGE_KEY = "sizeOfAnything_history";
 
+// Stop simplifying once the result has at least this fraction of the target points
+const SIMPLIFY_TARGET_SLACK = 0.9;
+
+// Stop simplifying once the tolerance bracket is narrower than this (degrees)
+const SIMPLIFY_MIN_TOLERANCE_STEP = 1e-7;
+
 // Load history from localStorage when creating the store
 const loadHistory = (): GeoJSONFeature[] => {
   if (typeof window === "undefined") return []; // For SSR safety
@@ -96,8 +105,9 @@ const saveHistory = (history: GeoJSONFeature[]) => {
 
   // Ensure all history items have a location property if possible
   const processedHistory = history.map((item) => {
-    // Create a deep copy to avoid mutating the original
-    const itemCopy = JSON.parse(JSON.stringify(item));
+    // Only the properties are rewritten below, so copy those rather than
+    // deep-cloning the geometry just to serialize it again
+    const itemCopy = { ...item, properties: { ...item.properties } };
 
     // If location is missing but name has a comma, extract location
     if (
@@ -113,9 +123,14 @@ const saveHistory = (history: GeoJSONFeature[]) => {
     return itemCopy;
   });
 
-  console.log("Finall Processed HIstory: ", processedHistory);
+  console.log(`Saving ${processedHistory.length} history items`);
 
-  localStorage.setItem(HISTORY_STORAGE_KEY, JSON.stringify(processedHistory));
+  try {
+    localStorage.setItem(HISTORY_STORAGE_KEY, JSON.stringify(processedHistory));
+  } catch (e) {
+    // Most likely the storage quota is full; keep the in-memory history anyway
+    console.warn("Failed to save history:", e);
+  }
 };
 
 // Bigger is less detail, smaller is more detail
@@ -165,14 +180,7 @@ export const useMapStore = create<MapState>((set) => ({
       }
       const placeAtCenter = options?.placeAtCenter === true;
       feature = workingFeature;
-      let { type, coordinates } = feature.geometry;
-
-      // Count total coordinate points in the geometry
-      // Recursively count the number of coordinate points in a GeoJSON geometry
-      const countCoordinates = (coords: any[]): number =>
-        Array.isArray(coords[0])
-          ? coords.reduce((sum: number, c: any) => sum + countCoordinates(c), 0)
-          : 1;
+      let { type, coordinates, coordinateCount } = feature.geometry;
 
       function simplifyToTargetPoints(
         feature: GeoJSONFeature,
@@ -191,6 +199,9 @@ export const useMapStore = create<MapState>((set) => ({
         let maxTol = 1; // ~5km in degrees, adjust if needed
         let bestTol = minTol;
 
+        // Each iteration simplifies the whole geometry, so stop as soon as
+        // we land close enough below the target or the tolerance converges
+        let bestFeature: GeoJSONFeature | null = null;
         for (let i = 0; i < maxIterations; i++) {
           const midTol = (minTol + maxTol) / 2;
           const simplified = turf.simplify(feature, {
@@ -207,23 +218,32 @@ export const useMapStore = create<MapState>((set) => ({
           } else {
             // Under target → maybe too simplified, try lowering tolerance
             bestTol = midTol;
+            bestFeature = simplified;
             maxTol = midTol;
+            if (newCount >= targetPoints * SIMPLIFY_TARGET_SLACK) break;
           }
+
+          if (maxTol - minTol < SIMPLIFY_MIN_TOLERANCE_STEP) break;
         }
 
-        const finalFeature = turf.simplify(feature, {
-          tolerance: bestTol,
-          highQuality: false,
-          mutate: false,
-        });
+        // Reuse the best attempt rather than simplifying once more
+        const finalFeature =
+          bestFeature ??
+          turf.simplify(feature, {
+            tolerance: bestTol,
+            highQuality: false,
+            mutate: false,
+          });
 
+        const finalCount = countCoordinates(finalFeature.geometry.coordinates);
         console.log(
-          `Simplified geometry from ${totalPoints} → ${countCoordinates(
-            finalFeature.geometry.coordinates
-          )} points (tolerance=${bestTol})`
+          `Simplified geometry from ${totalPoints} → ${finalCount} points (tolerance=${bestTol})`
         );
 
-        return finalFeature;
+        return {
+          ...finalFeature,
+          geometry: { ...finalFeature.geometry, coordinateCount: finalCount },
+        } as GeoJSONFeature;
       }
 
       const targetPoints = getSimplifyToNumPoints();
@@ -238,6 +258,7 @@ export const useMapStore = create<MapState>((set) => ({
         );
         type = simplified.geometry.type;
         coordinates = simplified.geometry.coordinates;
+        coordinateCount = simplified.geometry.coordinateCount;
       }
 
       // Generate a unique color for this feature
@@ -276,6 +297,7 @@ export const useMapStore = create<MapState>((set) => ({
           ...feature.geometry,
           type,
           coordinates,
+          coordinateCount,
           currentCoordinates: JSON.parse(JSON.stringify(coordinates)), // Deep clone
         },
         properties: {
@@ -607,8 +629,13 @@ export const useMapStore = create<MapState>((set) => ({
   // Add a feature to history
   addToHistory: (feature) => {
     set((state) => {
-      // Create a copy of the feature to ensure we don't modify the original
-      const featureCopy = JSON.parse(JSON.stringify(feature));
+      // Create a copy of the feature to ensure we don't modify the original.
+      // Geometry is never edited in place (updates replace it), so it can be
+      // shared; only the properties object needs its own copy.
+      const featureCopy: GeoJSONFeature = {
+        ...feature,
+        properties: { ...feature.properties },
+      };
       console.log("Feature copy location: ", featureCopy.properties.location);
 
       // Make sure location property is preserved
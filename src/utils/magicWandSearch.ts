@@ -4,6 +4,7 @@
 import type { GeoJSONFeature } from "../state/mapStoreTypes";
 import { countCoordinates, fixMultiPolygon } from "../components/utils/geometryUtils";
 import { describeOsmObject } from "../components/utils/describeOsmObject";
+import { nominatimLookup, overpassGet } from "./osmApi";
 
 export async function fetchFeaturesAtPoint(lat: number, lng: number): Promise<GeoJSONFeature[]> {
   const features = await fetchFeaturesUsingOverpass(lat, lng);
@@ -12,67 +13,53 @@ export async function fetchFeaturesAtPoint(lat: number, lng: number): Promise<Ge
 
 async function fetchFeaturesUsingOverpass(lat: number, lng: number): Promise<GeoJSONFeature[]> {
   const distance = 25;
+  // Round to ~1m so nearby clicks produce the same (cacheable) query
+  const qLat = lat.toFixed(5);
+  const qLng = lng.toFixed(5);
+  // Untagged ways/relations (e.g. bare multipolygon members) are dropped by
+  // Overpass itself so they are never serialized or downloaded. Only the ids
+  // are needed to look the elements up on Nominatim, so nothing else is output
   const query = `
     [out:json][timeout:25];
     (
-      is_in(${lat}, ${lng});
-      way(around:${distance},${lat},${lng});
-      relation(around:${distance},${lat},${lng});
+      way(around:${distance},${qLat},${qLng})(if:count_tags() > 0);
+      relation(around:${distance},${qLat},${qLng})(if:count_tags() > 0);
     );
-    out body;
+    out ids;
   `;
 
-  const response = await fetch("https://overpass-api.de/api/interpreter", {
-    method: "POST",
-    body: `data=${encodeURIComponent(query)}`,
-    headers: { "Content-Type": "application/x-www-form-urlencoded" },
-  });
-
-  if (!response.ok) throw new Error(`Overpass API error: ${response.statusText}`);
-
-  const data = await response.json();
+  const data = await overpassGet(query);
+  // The query only returns tagged ways/relations, so only the type is checked
   const candidates = data.elements.filter(
-    (el: any) => (el.type === "way" || el.type === "relation") && el.tags
+    (el: any) => el.type === "way" || el.type === "relation"
   );
 
   if (candidates.length === 0) return [];
 
   const nominatimIds = candidates.map((el: any) => `${el.type === "way" ? "W" : "R"}${el.id}`);
-  const batchSize = 50;
-  const features: GeoJSONFeature[] = [];
-
-  for (let i = 0; i < nominatimIds.length; i += batchSize) {
-    const batch = nominatimIds.slice(i, i + batchSize);
-    const url = `https://nominatim.openstreetmap.org/lookup?osm_ids=${batch.join(",")}&format=json&polygon_geojson=1&extratags=1`;
-    const res = await fetch(url);
-    if (!res.ok) continue;
-
-    const places = await res.json();
-    for (const place of places) {
-      if (!place.geojson || (place.geojson.type !== "Polygon" && place.geojson.type !== "MultiPolygon")) continue;
-      const feature: GeoJSONFeature = {
-        type: "Feature",
-        geometry: {
-          type: place.geojson.type === "Polygon" ? "Polygon" : "MultiPolygon",
-          coordinates: place.geojson.coordinates,
-          coordinateCount: countCoordinates(place.geojson.coordinates),
-        },
-        properties: {
-          name: place.display_name,
-          osmType: place.osm_type,
-          osmId: place.osm_id?.toString(),
-          osmClass: place.class,
-          whatIsIt: describeOsmObject(place),
-          source: place.address && (place.address.city || place.address.county || place.address.state) ? "containing" : "nearby",
-          adminLevel: place.extratags?.admin_level ? parseInt(place.extratags.admin_level, 10) : 0,
-          tags: place.extratags || {},
-        },
-      };
-      features.push(fixMultiPolygon(feature));
-    }
-  }
-
-  return features;
+  // Each place is converted as soon as its lookup batch arrives
+  return nominatimLookup(nominatimIds, (place: any): GeoJSONFeature | null => {
+    if (!place.geojson || (place.geojson.type !== "Polygon" && place.geojson.type !== "MultiPolygon")) return null;
+    const feature: GeoJSONFeature = {
+      type: "Feature",
+      geometry: {
+        type: place.geojson.type === "Polygon" ? "Polygon" : "MultiPolygon",
+        coordinates: place.geojson.coordinates,
+        coordinateCount: countCoordinates(place.geojson.coordinates),
+      },
+      properties: {
+        name: place.display_name,
+        osmType: place.osm_type,
+        osmId: place.osm_id?.toString(),
+        osmClass: place.class,
+        whatIsIt: describeOsmObject(place),
+        source: place.address && (place.address.city || place.address.county || place.address.state) ? "containing" : "nearby",
+        adminLevel: place.extratags?.admin_level ? parseInt(place.extratags.admin_level, 10) : 0,
+        tags: place.extratags || {},
+      },
+    };
+    return fixMultiPolygon(feature);
+  });
 }
 
 function organizeFeatures(features: GeoJSONFeature[]): GeoJSONFeature[] {
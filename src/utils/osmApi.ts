@@ -0,0 +1,275 @@
+/**
+ * Shared helpers for querying the OpenStreetMap Overpass and Nominatim APIs.
+ * Overpass responses are cached in localStorage so repeated queries for the
+ * same place are answered from disk instead of going back over the network.
+ * Nominatim responses carry full polygons, so they are only kept in memory.
+ */
+
+const OVERPASS_URL = "https://overpass-api.de/api/interpreter";
+const NOMINATIM_LOOKUP_URL = "https://nominatim.openstreetmap.org/lookup";
+
+// Nominatim accepts at most 50 ids per lookup request
+const NOMINATIM_LOOKUP_BATCH_SIZE = 50;
+
+// Nominatim's usage policy allows at most one request per second
+const NOMINATIM_MIN_REQUEST_INTERVAL_MS = 1000;
+
+// How many parsed Nominatim responses to keep for repeat searches this session.
+// Each can hold several MB of polygon coordinates, so only the last few are kept
+const NOMINATIM_CACHE_MAX_ENTRIES = 4;
+
+// Give up on a request that hasn't responded within this time
+const REQUEST_TIMEOUT_MS = 60 * 1000;
+
+// Rate-limited and gateway errors are transient on the public OSM servers
+const RETRY_STATUS_CODES = [429, 502, 504];
+const MAX_RETRIES = 3;
+const RETRY_BACKOFF_MS = 1500;
+// Upper bound on any single retry wait, including a server-sent Retry-After
+const MAX_RETRY_DELAY_MS = 10 * 1000;
+
+// Key prefix for cached Overpass responses in localStorage
+const OVERPASS_CACHE_PREFIX = "sizeOfAnything_overpass_";
+
+// How long a cached Overpass response is considered fresh (24 hours)
+const OVERPASS_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
+
+// Most cached Overpass responses to keep; localStorage is shared with history
+const OVERPASS_CACHE_MAX_ENTRIES = 50;
+
+interface CachedOverpassResponse {
+  query: string;
+  timestamp: number;
+  data: any;
+}
+
+/**
+ * fetch() with a timeout that retries transient failures (rate limiting and
+ * gateway errors) with exponential backoff, honoring Retry-After when given.
+ */
+async function fetchWithRetry(
+  url: string,
+  init?: RequestInit,
+  // Awaited before every attempt, including retries (e.g. for rate limiting)
+  beforeAttempt?: () => Promise<void>
+): Promise<Response> {
+  for (let attempt = 0; ; attempt++) {
+    if (beforeAttempt) await beforeAttempt();
+    const controller = new AbortController();
+    const id = setTimeout(() => controller.abort(), REQUEST_TIMEOUT_MS);
+    const response = await fetch(url, {
+      ...init,
+      signal: controller.signal,
+    }).finally(() => clearTimeout(id));
+
+    if (!RETRY_STATUS_CODES.includes(response.status) || attempt >= MAX_RETRIES) {
+      return response;
+    }
+
+    const retryAfterSeconds = Number(response.headers.get("Retry-After"));
+    const delay = Math.min(
+      retryAfterSeconds > 0
+        ? retryAfterSeconds * 1000
+        : RETRY_BACKOFF_MS * 2 ** attempt,
+      MAX_RETRY_DELAY_MS
+    );
+    console.warn(`Request failed with ${response.status}, retrying in ${delay}ms`);
+    await new Promise((resolve) => setTimeout(resolve, delay));
+  }
+}
+
+/**
+ * Hash a query string into a short, stable cache key (32-bit FNV-1a)
+ */
+function hashQuery(query: string): string {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < query.length; i++) {
+    hash ^= query.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0).toString(16);
+}
+
+function readCachedResponse(cacheKey: string, query: string): any | null {
+  if (typeof window === "undefined") return null; // For SSR safety
+
+  try {
+    const saved = localStorage.getItem(cacheKey);
+    if (!saved) return null;
+
+    const entry = JSON.parse(saved) as CachedOverpassResponse;
+    // Guard against hash collisions and stale entries
+    if (
+      entry.query !== query ||
+      Date.now() - entry.timestamp > OVERPASS_CACHE_TTL_MS
+    ) {
+      localStorage.removeItem(cacheKey);
+      return null;
+    }
+    return entry.data;
+  } catch (e) {
+    console.warn("Failed to read cached Overpass response:", e);
+    localStorage.removeItem(cacheKey);
+    return null;
+  }
+}
+
+/**
+ * Remove expired Overpass cache entries and, if there are still too many,
+ * the oldest ones, leaving room for one more entry
+ */
+function pruneCachedResponses() {
+  const now = Date.now();
+  const entries: { key: string; timestamp: number }[] = [];
+
+  for (let i = 0; i < localStorage.length; i++) {
+    const key = localStorage.key(i);
+    if (!key || !key.startsWith(OVERPASS_CACHE_PREFIX)) continue;
+
+    let timestamp = 0;
+    try {
+      const entry = JSON.parse(
+        localStorage.getItem(key) ?? ""
+      ) as CachedOverpassResponse;
+      timestamp = Number(entry.timestamp) || 0;
+    } catch (e) {
+      // Unreadable entries are treated as expired
+    }
+    entries.push({ key, timestamp });
+  }
+
+  // Newest first, so everything past the cap (or expired) can be dropped
+  entries.sort((a, b) => b.timestamp - a.timestamp);
+  entries.forEach(({ key, timestamp }, index) => {
+    if (
+      index >= OVERPASS_CACHE_MAX_ENTRIES - 1 ||
+      now - timestamp > OVERPASS_CACHE_TTL_MS
+    ) {
+      localStorage.removeItem(key);
+    }
+  });
+}
+
+function writeCachedResponse(cacheKey: string, query: string, data: any) {
+  if (typeof window === "undefined") return; // For SSR safety
+
+  try {
+    pruneCachedResponses();
+  } catch (e) {
+    console.warn("Failed to prune cached Overpass responses:", e);
+  }
+
+  const entry: CachedOverpassResponse = { query, timestamp: Date.now(), data };
+  try {
+    localStorage.setItem(cacheKey, JSON.stringify(entry));
+  } catch (e) {
+    // Most likely the storage quota is full; caching is best-effort only
+    console.warn("Failed to cache Overpass response:", e);
+  }
+}
+
+/**
+ * Run an Overpass QL query and return the parsed JSON response.
+ * Identical queries made within the cache TTL are served from localStorage.
+ */
+export async function overpassGet(query: string): Promise<any> {
+  const cacheKey = OVERPASS_CACHE_PREFIX + hashQuery(query);
+  const cached = readCachedResponse(cacheKey, query);
+  if (cached !== null) return cached;
+
+  const response = await fetchWithRetry(OVERPASS_URL, {
+    method: "POST",
+    body: `data=${encodeURIComponent(query)}`,
+    headers: { "Content-Type": "application/x-www-form-urlencoded" },
+  });
+
+  if (!response.ok) throw new Error(`Overpass API error: ${response.statusText}`);
+
+  const data = await response.json();
+  // Overpass reports timeouts and out-of-memory errors with a 200 status and a
+  // "remark", often alongside partial results, so only cache complete answers
+  if (!data?.remark && Array.isArray(data?.elements)) {
+    writeCachedResponse(cacheKey, query, data);
+  } else if (data?.remark) {
+    console.warn(`Overpass API remark: ${data.remark}`);
+  }
+  return data;
+}
+
+// Earliest time the next Nominatim request may be sent
+let nextNominatimRequestAt = 0;
+
+/**
+ * Wait for the next free Nominatim request slot, so that requests from all
+ * callers (and their retries) are spaced at least one interval apart
+ */
+async function waitForNominatimSlot() {
+  const now = Date.now();
+  const startAt = Math.max(now, nextNominatimRequestAt);
+  nextNominatimRequestAt = startAt + NOMINATIM_MIN_REQUEST_INTERVAL_MS;
+  if (startAt > now) {
+    await new Promise((resolve) => setTimeout(resolve, startAt - now));
+  }
+}
+
+// Parsed Nominatim responses keyed by request URL, oldest first
+const nominatimCache = new Map<string, any>();
+
+/**
+ * Fetch a Nominatim URL and return the parsed JSON, or null if Nominatim
+ * answered with an error status. Requests are rate limited to Nominatim's
+ * usage policy; repeating a recent request (e.g. searching the same place
+ * again) reuses the already parsed response without waiting.
+ */
+export async function nominatimGet(url: string): Promise<any | null> {
+  if (nominatimCache.has(url)) {
+    const cached = nominatimCache.get(url);
+    // Re-insert so the entry counts as most recently used
+    nominatimCache.delete(url);
+    nominatimCache.set(url, cached);
+    return cached;
+  }
+
+  const response = await fetchWithRetry(url, undefined, waitForNominatimSlot);
+  if (!response.ok) {
+    console.warn(`Nominatim API error: ${response.statusText}`);
+    return null;
+  }
+
+  const data = await response.json();
+  nominatimCache.set(url, data);
+  if (nominatimCache.size > NOMINATIM_CACHE_MAX_ENTRIES) {
+    // Evict the least recently used entry
+    const oldestUrl = nominatimCache.keys().next().value;
+    if (oldestUrl !== undefined) nominatimCache.delete(oldestUrl);
+  }
+  return data;
+}
+
+/**
+ * Look up OSM objects (ids like "W123" or "R456") on Nominatim, including their
+ * polygon GeoJSON. The ids are requested in batches, one after the other, and
+ * each place is passed to `toResult` as soon as its batch arrives; places it
+ * maps to null are dropped. Failed batches are skipped.
+ */
+export async function nominatimLookup<T>(
+  osmIds: string[],
+  toResult: (place: any) => T | null
+): Promise<T[]> {
+  const results: T[] = [];
+
+  for (let i = 0; i < osmIds.length; i += NOMINATIM_LOOKUP_BATCH_SIZE) {
+    const batch = osmIds.slice(i, i + NOMINATIM_LOOKUP_BATCH_SIZE);
+    const url = `${NOMINATIM_LOOKUP_URL}?osm_ids=${batch.join(
+      ","
+    )}&format=json&polygon_geojson=1&extratags=1`;
+    const places: any[] = (await nominatimGet(url)) ?? [];
+
+    for (const place of places) {
+      const result = toResult(place);
+      if (result !== null) results.push(result);
+    }
+  }
+
+  return results;
+}